@@ -56,6 +56,8 @@ class ScviConfig:
         logging_dir: str = "./scvi_log/",
         dl_num_workers: int = 0,
         dl_persistent_workers: bool = False,
+        dl_pin_memory: bool = False,
+        autocast_inference: bool = False,
         jax_preallocate_gpu_memory: bool = False,
         warnings_stacklevel: int = 2,
     ):
@@ -68,6 +70,8 @@ class ScviConfig:
         self.logging_dir = logging_dir
         self.dl_num_workers = dl_num_workers
         self.dl_persistent_workers = dl_persistent_workers
+        self.dl_pin_memory = dl_pin_memory
+        self.autocast_inference = autocast_inference
         self._num_threads = None
         self.jax_preallocate_gpu_memory = jax_preallocate_gpu_memory
         self.verbosity = verbosity
@@ -100,6 +104,35 @@ class ScviConfig:
         """Number of workers for PyTorch data loaders (Default is 0)."""
         self._dl_num_workers = dl_num_workers
 
+    @property
+    def autocast_inference(self) -> bool:
+        """Whether to run inference-mode model methods under bfloat16 autocast (Default False).
+
+        Halves the activation bandwidth of methods such as
+        :meth:`~scvi.model.base.VAEMixin.get_latent_representation` on accelerators with
+        native bfloat16 support. Final outputs are always cast back to float32.
+        """
+        return self._autocast_inference
+
+    @autocast_inference.setter
+    def autocast_inference(self, autocast_inference: bool):
+        """Whether to run inference-mode model methods under bfloat16 autocast (Default False)."""
+        self._autocast_inference = autocast_inference
+
+    @property
+    def dl_pin_memory(self) -> bool:
+        """Whether to use pin_memory in PyTorch data loaders (Default is False).
+
+        Pinned (page-locked) host memory allows the non-blocking host-to-device copies
+        performed when minibatches are moved to an accelerator to overlap with compute.
+        """
+        return self._dl_pin_memory
+
+    @dl_pin_memory.setter
+    def dl_pin_memory(self, dl_pin_memory: bool):
+        """Whether to use pin_memory in PyTorch data loaders (Default is False)."""
+        self._dl_pin_memory = dl_pin_memory
+
     @property
     def dl_persistent_workers(self) -> bool:
         """Whether to use persistent_workers in PyTorch data loaders (Default is False)."""
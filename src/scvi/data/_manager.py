@@ -14,7 +14,6 @@ from rich import box
 from rich.console import Console
 from torch.utils.data import Subset
 
-import scvi
 from scvi.utils import attrdict
 
 from . import _constants
@@ -92,12 +91,15 @@ class AnnDataManager:
         setup_method_args: dict | None = None,
         validation_checks: AnnDataManagerValidationCheck | None = None,
     ) -> None:
+        # deferred to avoid a module-scope circular import of the package root
+        from scvi import __version__
+
         self.id = str(uuid4())
         self.adata = None
         self.fields = fields or []
         self.validation_checks = validation_checks or AnnDataManagerValidationCheck()
         self._registry = {
-            _constants._SCVI_VERSION_KEY: scvi.__version__,
+            _constants._SCVI_VERSION_KEY: __version__,
             _constants._MODEL_NAME_KEY: None,
             _constants._SETUP_ARGS_KEY: None,
             _constants._FIELD_REGISTRIES_KEY: defaultdict(dict),
@@ -273,9 +273,11 @@ def _check_nonnegative_integers(
     if data.shape[0] != 0:
         inds = np.random.choice(data.shape[0], size=(n_to_check,))
         check = data[inds]
-        negative = np.any(check < 0)
-        non_integer = np.any(check % 1 != 0)
-        ret = not (negative or non_integer)
+        if np.any(check < 0):
+            ret = False
+        else:
+            # the modulo pass is only needed when no negative entry was found
+            ret = not np.any(check % 1 != 0)
     return ret
 
 
@@ -102,6 +102,8 @@ class AnnDataLoader(DataLoader):
             kwargs["num_workers"] = settings.dl_num_workers
         if "persistent_workers" not in kwargs:
             kwargs["persistent_workers"] = settings.dl_persistent_workers
+        if "pin_memory" not in kwargs:
+            kwargs["pin_memory"] = settings.dl_pin_memory
 
         self.kwargs = copy.deepcopy(kwargs)
 
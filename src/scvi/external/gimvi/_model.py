@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import os
+import pickle
 import warnings
 from itertools import cycle
 from typing import TYPE_CHECKING
@@ -421,15 +422,17 @@ class GIMVI(VAEMixin, BaseModelClass):
         anndata_write_kwargs
             Kwargs for anndata write function
         """
-        if not os.path.exists(dir_path) or overwrite:
+        try:
             os.makedirs(dir_path, exist_ok=overwrite)
-        else:
+        except FileExistsError as exc:
             raise ValueError(
                 f"{dir_path} already exists. Please provide an unexisting directory for saving."
-            )
+            ) from exc
 
         file_name_prefix = prefix or ""
         save_kwargs = save_kwargs or {}
+        # protocol 5 serializes numpy arrays in the attr dict as out-of-band buffers
+        save_kwargs.setdefault("pickle_protocol", pickle.HIGHEST_PROTOCOL)
 
         seq_adata = self.adatas[0]
         spatial_adata = self.adatas[1]
@@ -446,13 +449,14 @@ class GIMVI(VAEMixin, BaseModelClass):
         seq_var_names = seq_adata.var_names.astype(str).to_numpy()
         spatial_var_names = spatial_adata.var_names.astype(str).to_numpy()
 
-        # get all the user attributes
-        user_attributes = self._get_user_attributes()
         # only save the public attributes with _ at the very end
-        user_attributes = {a[0]: a[1] for a in user_attributes if a[0][-1] == "_"}
+        user_attributes = dict(self._get_user_attributes(suffix="_"))
 
         model_save_path = os.path.join(dir_path, f"{file_name_prefix}model.pt")
 
+        # write to a sibling temp file and rename so a crash mid-save never leaves a
+        # truncated archive under the final name
+        tmp_save_path = f"{model_save_path}.tmp"
         torch.save(
             {
                 "model_state_dict": model_state_dict,
@@ -460,9 +464,10 @@ class GIMVI(VAEMixin, BaseModelClass):
                 "spatial_var_names": spatial_var_names,
                 "attr_dict": user_attributes,
             },
-            model_save_path,
+            tmp_save_path,
             **save_kwargs,
         )
+        os.replace(tmp_save_path, model_save_path)
 
     @classmethod
     @devices_dsp.dedent
@@ -233,7 +233,7 @@ class METHYLVAE(BaseModuleClass):
             kl_local=kl_local,
         )
 
-    @torch.no_grad()
+    @torch.inference_mode()
     def sample(
         self,
         tensors,
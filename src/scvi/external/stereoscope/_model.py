@@ -297,7 +297,7 @@ class SpatialStereoscope(UnsupervisedTrainingMixin, BaseModelClass):
                 "cell type query."
             )
         px_scale = self.module.get_ct_specific_expression(torch.tensor(ind_y)[:, None])
-        return np.array(px_scale.cpu())
+        return px_scale.detach().cpu().numpy()
 
     @devices_dsp.dedent
     def train(
@@ -617,7 +617,7 @@ class VELOVAE(BaseModuleClass):
         """Not implemented."""
         raise NotImplementedError
 
-    @torch.no_grad()
+    @torch.inference_mode()
     def get_loadings(self) -> np.ndarray:
         """Extract per-gene weights in the linear decoder."""
         # This is BW, where B is diag(b) batch norm, W is weight matrix
@@ -925,7 +925,7 @@ class MULTIVI(VAEMixin, UnsupervisedTrainingMixin, BaseModelClass, ArchesMixin):
 
         return result
 
-    @torch.no_grad()
+    @torch.inference_mode()
     def get_protein_foreground_probability(
         self,
         adata: AnnData | None = None,
@@ -4,8 +4,6 @@ import logging
 import warnings
 from typing import TYPE_CHECKING
 
-import numpy as np
-
 from scvi import REGISTRY_KEYS, settings
 from scvi.data import AnnDataManager
 from scvi.data._constants import _ADATA_MINIFY_TYPE_UNS_KEY, ADATA_MINIFY_TYPE
@@ -22,6 +20,7 @@ from scvi.data.fields import (
 from scvi.model._utils import _init_library_size
 from scvi.model.base import EmbeddingMixin, UnsupervisedTrainingMixin
 from scvi.model.utils import get_minified_adata_scrna
+from scvi.model.utils._minification import _observed_lib_size
 from scvi.module import VAE
 from scvi.utils import setup_anndata_dsp
 
@@ -156,23 +155,23 @@ class SCVI(
                 stacklevel=settings.warnings_stacklevel,
             )
         else:
+            adata_manager = self.adata_manager
+            summary_stats = self.summary_stats
             n_cats_per_cov = (
-                self.adata_manager.get_state_registry(REGISTRY_KEYS.CAT_COVS_KEY).n_cats_per_key
-                if REGISTRY_KEYS.CAT_COVS_KEY in self.adata_manager.data_registry
+                adata_manager.get_state_registry(REGISTRY_KEYS.CAT_COVS_KEY).n_cats_per_key
+                if REGISTRY_KEYS.CAT_COVS_KEY in adata_manager.data_registry
                 else None
             )
-            n_batch = self.summary_stats.n_batch
-            use_size_factor_key = REGISTRY_KEYS.SIZE_FACTOR_KEY in self.adata_manager.data_registry
+            n_batch = summary_stats.n_batch
+            use_size_factor_key = REGISTRY_KEYS.SIZE_FACTOR_KEY in adata_manager.data_registry
             library_log_means, library_log_vars = None, None
             if not use_size_factor_key and self.minified_data_type is None:
-                library_log_means, library_log_vars = _init_library_size(
-                    self.adata_manager, n_batch
-                )
+                library_log_means, library_log_vars = _init_library_size(adata_manager, n_batch)
             self.module = self._module_cls(
-                n_input=self.summary_stats.n_vars,
+                n_input=summary_stats.n_vars,
                 n_batch=n_batch,
-                n_labels=self.summary_stats.n_labels,
-                n_continuous_cov=self.summary_stats.get("n_extra_continuous_covs", 0),
+                n_labels=summary_stats.n_labels,
+                n_continuous_cov=summary_stats.get("n_extra_continuous_covs", 0),
                 n_cats_per_cov=n_cats_per_cov,
                 n_hidden=n_hidden,
                 n_latent=n_latent,
@@ -306,6 +305,6 @@ class SCVI(
         minified_adata.obsm[_SCVI_LATENT_QZM] = self.adata.obsm[use_latent_qzm_key]
         minified_adata.obsm[_SCVI_LATENT_QZV] = self.adata.obsm[use_latent_qzv_key]
         counts = self.adata_manager.get_from_registry(REGISTRY_KEYS.X_KEY)
-        minified_adata.obs[_SCVI_OBSERVED_LIB_SIZE] = np.squeeze(np.asarray(counts.sum(axis=1)))
+        minified_adata.obs[_SCVI_OBSERVED_LIB_SIZE] = _observed_lib_size(counts)
         self._update_adata_and_manager_post_minification(minified_adata, minified_data_type)
         self.module.minified_data_type = minified_data_type
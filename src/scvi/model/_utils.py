@@ -184,8 +184,15 @@ def scrna_raw_counts_properties(
 
     mean1 = np.asarray((data1).mean(axis=0)).ravel()
     mean2 = np.asarray((data2).mean(axis=0)).ravel()
-    nonz1 = np.asarray((data1 != 0).mean(axis=0)).ravel()
-    nonz2 = np.asarray((data2 != 0).mean(axis=0)).ravel()
+    if sp_sparse.issparse(data):
+        # count the stored non-zero entries per gene instead of materializing boolean
+        # copies of the subsets; unlike getnnz, count_nonzero skips explicitly stored
+        # zeros and exists on both the spmatrix and sparray containers
+        nonz1 = data1.count_nonzero(axis=0) / data1.shape[0]
+        nonz2 = data2.count_nonzero(axis=0) / data2.shape[0]
+    else:
+        nonz1 = np.count_nonzero(data1, axis=0) / data1.shape[0]
+        nonz2 = np.count_nonzero(data2, axis=0) / data2.shape[0]
 
     key = "_scvi_raw_norm_scaling"
     if key not in adata.obs.keys():
@@ -195,15 +202,10 @@ def scrna_raw_counts_properties(
     else:
         scaling_factor = adata.obs[key].to_numpy().ravel().reshape(-1, 1)
 
-    if issubclass(type(data), sp_sparse.spmatrix):
-        norm_data1 = data1.multiply(scaling_factor[idx1])
-        norm_data2 = data2.multiply(scaling_factor[idx2])
-    else:
-        norm_data1 = data1 * scaling_factor[idx1]
-        norm_data2 = data2 * scaling_factor[idx2]
-
-    norm_mean1 = np.asarray(norm_data1.mean(axis=0)).ravel()
-    norm_mean2 = np.asarray(norm_data2.mean(axis=0)).ravel()
+    # mean over cells of s_n * x_ng reduces to a vector-matrix product, so the
+    # scaled matrix is never materialized (works for both sparse and dense data)
+    norm_mean1 = np.asarray(scaling_factor[idx1].ravel() @ data1).ravel() / data1.shape[0]
+    norm_mean2 = np.asarray(scaling_factor[idx2].ravel() @ data2).ravel() / data2.shape[0]
 
     properties = {
         "raw_mean1": mean1,
@@ -335,28 +337,34 @@ def _init_library_size(
         and the variance defaults to 1. These defaults are arbitrary placeholders which
         should not be used in any downstream computation.
     """
+    from scvi.model.utils._minification import _observed_lib_size
+
     data = adata_manager.get_from_registry(REGISTRY_KEYS.X_KEY)
-    batch_indices = adata_manager.get_from_registry(REGISTRY_KEYS.BATCH_KEY)
+    batch_indices = np.squeeze(
+        np.asarray(adata_manager.get_from_registry(REGISTRY_KEYS.BATCH_KEY))
+    )
 
     library_log_means = np.zeros(n_batch)
     library_log_vars = np.ones(n_batch)
 
+    # one pass over the matrix yields every cell's library size; the per-batch
+    # statistics then reduce over slices of the resulting 1-D vector instead of
+    # re-slicing the count matrix once per batch
+    sum_counts = _observed_lib_size(data)
+    masked_log_sum = np.ma.log(sum_counts)
+    if np.ma.is_masked(masked_log_sum):
+        warnings.warn(
+            "This dataset has some empty cells, this might fail inference."
+            "Data should be filtered with `scanpy.pp.filter_cells()`",
+            UserWarning,
+            stacklevel=settings.warnings_stacklevel,
+        )
+    log_counts = masked_log_sum.filled(0)
+
     for i_batch in np.unique(batch_indices):
-        idx_batch = np.squeeze(batch_indices == i_batch)
-        batch_data = data[idx_batch.nonzero()[0]]  # h5ad requires integer indexing arrays.
-        sum_counts = batch_data.sum(axis=1)
-        masked_log_sum = np.ma.log(sum_counts)
-        if np.ma.is_masked(masked_log_sum):
-            warnings.warn(
-                "This dataset has some empty cells, this might fail inference."
-                "Data should be filtered with `scanpy.pp.filter_cells()`",
-                UserWarning,
-                stacklevel=settings.warnings_stacklevel,
-            )
-
-        log_counts = masked_log_sum.filled(0)
-        library_log_means[i_batch] = np.mean(log_counts).astype(np.float32)
-        library_log_vars[i_batch] = np.var(log_counts).astype(np.float32)
+        batch_log_counts = log_counts[batch_indices == i_batch]
+        library_log_means[i_batch] = np.mean(batch_log_counts).astype(np.float32)
+        library_log_vars[i_batch] = np.var(batch_log_counts).astype(np.float32)
 
     return library_log_means.reshape(1, -1), library_log_vars.reshape(1, -1)
 
@@ -356,8 +356,7 @@ def _get_loaded_data(reference_model, device=None):
             reference_model, load_adata=False, map_location=device
         )
     else:
-        attr_dict = reference_model._get_user_attributes()
-        attr_dict = {a[0]: a[1] for a in attr_dict if a[0][-1] == "_"}
+        attr_dict = dict(reference_model._get_user_attributes(suffix="_"))
         var_names = _get_var_names(reference_model.adata)
         load_state_dict = deepcopy(reference_model.module.state_dict())
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 import inspect
 import logging
 import os
+import pickle
 import warnings
 from abc import ABCMeta, abstractmethod
 from typing import TYPE_CHECKING
@@ -457,6 +458,14 @@ class BaseModelClass(metaclass=BaseModelMetaClass):
         if adata is None:
             adata = self.adata
 
+        # Fast path for the AnnData the model was initialized with: it was fully
+        # validated at registration time and cannot be a view, so only the cheap
+        # manager-identity check needs to be replayed.
+        manager = getattr(self, "_adata_manager", None)
+        if manager is not None and adata is manager.adata:
+            manager.validate()
+            return adata
+
         _check_if_view(adata, copy_if_view=copy_if_view)
 
         adata_manager = self.get_anndata_manager(adata)
@@ -524,35 +533,53 @@ class BaseModelClass(metaclass=BaseModelMetaClass):
         """Returns computed metrics during training."""
         return self.history_
 
-    def _get_user_attributes(self):
-        """Returns all the self attributes defined in a model class, e.g., `self.is_trained_`."""
-        attributes = inspect.getmembers(self, lambda a: not (inspect.isroutine(a)))
-        attributes = [a for a in attributes if not (a[0].startswith("__") and a[0].endswith("__"))]
-        attributes = [a for a in attributes if not a[0].startswith("_abc_")]
-        return attributes
+    def _get_user_attributes(self, suffix: str | None = None):
+        """Returns all the self attributes defined in a model class, e.g., `self.is_trained_`.
+
+        Only instance attributes are scanned; class-level properties are skipped so that
+        their getters are not evaluated as a side effect. If ``suffix`` is given, only
+        attributes whose names end with it are returned.
+        """
+        return [
+            (k, v)
+            for k, v in vars(self).items()
+            if not k.startswith("_abc_") and (suffix is None or k.endswith(suffix))
+        ]
+
+    @classmethod
+    def _init_signature_params(cls) -> tuple[frozenset[str], frozenset[str]]:
+        """Returns the (non-variable, variable) parameter names of ``cls.__init__``.
+
+        The signature cannot change at runtime, so it is reflected on once per class
+        rather than on every model construction.
+        """
+        if "_init_signature_params_cache" not in cls.__dict__:
+            parameters = inspect.signature(cls.__init__).parameters.values()
+            # the unbound signature includes ``self``, which must not be captured
+            cls._init_signature_params_cache = (
+                frozenset(
+                    p.name for p in parameters if p.name != "self" and p.kind != p.VAR_KEYWORD
+                ),
+                frozenset(p.name for p in parameters if p.kind == p.VAR_KEYWORD),
+            )
+        return cls._init_signature_params_cache
 
     def _get_init_params(self, locals):
         """Returns the model init signature with associated passed in values.
 
         Ignores the initial AnnData.
         """
-        init = self.__init__
-        sig = inspect.signature(init)
-        parameters = sig.parameters.values()
-
-        init_params = [p.name for p in parameters]
-        all_params = {p: locals[p] for p in locals if p in init_params}
+        non_var_names, var_names = self._init_signature_params()
         all_params = {
             k: v
-            for (k, v) in all_params.items()
-            if not isinstance(v, AnnData) and not isinstance(v, MuData)
+            for (k, v) in locals.items()
+            if (k in non_var_names or k in var_names)
+            and not isinstance(v, AnnData)
+            and not isinstance(v, MuData)
         }
-        # not very efficient but is explicit
         # separates variable params (**kwargs) from non variable params into two dicts
-        non_var_params = [p.name for p in parameters if p.kind != p.VAR_KEYWORD]
-        non_var_params = {k: v for (k, v) in all_params.items() if k in non_var_params}
-        var_params = [p.name for p in parameters if p.kind == p.VAR_KEYWORD]
-        var_params = {k: v for (k, v) in all_params.items() if k in var_params}
+        non_var_params = {k: v for (k, v) in all_params.items() if k in non_var_names}
+        var_params = {k: v for (k, v) in all_params.items() if k in var_names}
 
         user_params = {"kwargs": var_params, "non_kwargs": non_var_params}
 
@@ -570,6 +597,7 @@ class BaseModelClass(metaclass=BaseModelMetaClass):
         save_anndata: bool = False,
         save_kwargs: dict | None = None,
         legacy_mudata_format: bool = False,
+        save_safetensors: bool = False,
         **anndata_write_kwargs,
     ):
         """Save the state of the model.
@@ -597,20 +625,29 @@ class BaseModelClass(metaclass=BaseModelMetaClass):
             variable names across all modalities concatenated, while the new format is a dictionary
             with keys corresponding to the modality names and values corresponding to the variable
             names for each modality.
+        save_safetensors
+            If ``True``, saves the module state dict in a sidecar ``model.safetensors`` file
+            written with :func:`~safetensors.torch.save_file` instead of embedding it in
+            ``model.pt``. Loading memory-maps the raw tensor buffers directly. Requires the
+            optional ``safetensors`` dependency, and models saved this way cannot be loaded by
+            older scvi-tools versions.
         anndata_write_kwargs
             Kwargs for :meth:`~anndata.AnnData.write`
         """
         from scvi.model.base._save_load import _get_var_names
 
-        if not os.path.exists(dir_path) or overwrite:
+        try:
             os.makedirs(dir_path, exist_ok=overwrite)
-        else:
+        except FileExistsError as exc:
             raise ValueError(
                 f"{dir_path} already exists. Please provide another directory for saving."
-            )
+            ) from exc
 
         file_name_prefix = prefix or ""
         save_kwargs = save_kwargs or {}
+        # protocol 5 serializes the numpy arrays embedded in the attr dict
+        # (e.g. library_log_means_) as contiguous out-of-band buffers
+        save_kwargs.setdefault("pickle_protocol", pickle.HIGHEST_PROTOCOL)
 
         if save_anndata:
             file_suffix = ""
@@ -630,20 +667,33 @@ class BaseModelClass(metaclass=BaseModelMetaClass):
 
         var_names = _get_var_names(self.adata, legacy_mudata_format=legacy_mudata_format)
 
-        # get all the user attributes
-        user_attributes = self._get_user_attributes()
         # only save the public attributes with _ at the very end
-        user_attributes = {a[0]: a[1] for a in user_attributes if a[0][-1] == "_"}
+        user_attributes = dict(self._get_user_attributes(suffix="_"))
 
-        torch.save(
-            {
-                SAVE_KEYS.MODEL_STATE_DICT_KEY: model_state_dict,
-                SAVE_KEYS.VAR_NAMES_KEY: var_names,
-                SAVE_KEYS.ATTR_DICT_KEY: user_attributes,
-            },
-            model_save_path,
-            **save_kwargs,
-        )
+        save_dict = {
+            SAVE_KEYS.VAR_NAMES_KEY: var_names,
+            SAVE_KEYS.ATTR_DICT_KEY: user_attributes,
+        }
+        if save_safetensors:
+            from scvi.utils import error_on_missing_dependencies
+
+            error_on_missing_dependencies("safetensors")
+            from safetensors.torch import save_file
+
+            safetensors_path = os.path.join(
+                dir_path, f"{file_name_prefix}{SAVE_KEYS.MODEL_SAFETENSORS_FNAME}"
+            )
+            # written through a temp file and renamed, like the archive below
+            save_file(model_state_dict, f"{safetensors_path}.tmp")
+            os.replace(f"{safetensors_path}.tmp", safetensors_path)
+        else:
+            save_dict[SAVE_KEYS.MODEL_STATE_DICT_KEY] = model_state_dict
+
+        # write to a sibling temp file and rename so a crash mid-save never leaves a
+        # truncated archive under the final name (os.replace is atomic on POSIX)
+        tmp_save_path = f"{model_save_path}.tmp"
+        torch.save(save_dict, tmp_save_path, **save_kwargs)
+        os.replace(tmp_save_path, model_save_path)
 
     @classmethod
     @devices_dsp.dedent
@@ -725,9 +775,12 @@ class BaseModelClass(metaclass=BaseModelMetaClass):
 
         model = _initialize_model(cls, adata, attr_dict)
         model.module.on_load(model)
-        model.module.load_state_dict(model_state_dict)
 
+        # move the freshly initialized module to the target device before loading the
+        # state dict: the saved tensors were already mapped to `device`, so this avoids
+        # copying them to host just to move them back afterwards
         model.to_device(device)
+        model.module.load_state_dict(model_state_dict)
         model.module.eval()
         model._validate_anndata(adata)
         return model
@@ -757,13 +810,13 @@ class BaseModelClass(metaclass=BaseModelMetaClass):
         **save_kwargs
             Keyword arguments passed into :func:`~torch.save`.
         """
-        if not os.path.exists(output_dir_path) or overwrite:
+        try:
             os.makedirs(output_dir_path, exist_ok=overwrite)
-        else:
+        except FileExistsError as exc:
             raise ValueError(
                 f"{output_dir_path} already exists. Please provide an unexisting directory for "
                 "saving."
-            )
+            ) from exc
 
         file_name_prefix = prefix or ""
         model_state_dict, var_names, attr_dict, _ = _load_legacy_saved_files(
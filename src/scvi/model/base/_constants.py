@@ -5,6 +5,7 @@ class _SAVE_KEYS_NT(NamedTuple):
     ADATA_FNAME: str = "adata.h5ad"
     MDATA_FNAME: str = "mdata.h5mu"
     MODEL_FNAME: str = "model.pt"
+    MODEL_SAFETENSORS_FNAME: str = "model.safetensors"
     MODEL_STATE_DICT_KEY: str = "model_state_dict"
     VAR_NAMES_KEY: str = "var_names"
     ATTR_DICT_KEY: str = "attr_dict"
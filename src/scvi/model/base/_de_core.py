@@ -100,16 +100,19 @@ def _de_core(
 
     df_results = []
     dc = DifferentialComputation(model_fn, representation_fn, adata_manager)
+    # compare on the underlying array so each group membership test is a plain
+    # vectorized comparison rather than a pandas Series operation
+    groupby_col = adata.obs[groupby].to_numpy()
+    if group2 is not None:
+        cell_idx2 = groupby_col == group2
     for g1 in track(
         group1,
         description="DE...",
         disable=silent,
     ):
-        cell_idx1 = (adata.obs[groupby] == g1).to_numpy().ravel()
+        cell_idx1 = groupby_col == g1
         if group2 is None:
             cell_idx2 = ~cell_idx1
-        else:
-            cell_idx2 = (adata.obs[groupby] == group2).to_numpy().ravel()
 
         all_info = dc.get_bayes_factors(
             cell_idx1,
@@ -448,11 +448,12 @@ class DifferentialComputation:
             )
             n_samples = 2
 
-        selection = self.process_selection(selection)
+        # process_selection already yields integer indices, so the per-batch
+        # np.arange gather is redundant and is hoisted out of the loop
+        idx_selected = self.process_selection(selection)
         px_scales = []
         batch_ids = []
         for batch_idx in batchid:
-            idx_selected = np.arange(self.adata.shape[0])[selection]
             px_scales.append(
                 self.model_fn(
                     self.adata,
@@ -3,6 +3,7 @@ from __future__ import annotations
 import inspect
 import logging
 import warnings
+from contextlib import nullcontext
 from functools import partial
 from typing import TYPE_CHECKING
 
@@ -229,7 +230,14 @@ class RNASeqMixin:
             self.get_anndata_manager(adata, required=True), transform_batch
         )
 
-        gene_mask = slice(None) if gene_list is None else adata.var_names.isin(gene_list)
+        if gene_list is None:
+            gene_mask = slice(None)
+            gene_idx = None
+        else:
+            gene_mask = adata.var_names.isin(gene_list)
+            # cache the gather indices on the device so the mask is not re-transferred
+            # for every minibatch and conditioned batch
+            gene_idx = torch.as_tensor(np.flatnonzero(gene_mask), device=self.device)
 
         if n_samples > 1 and return_mean is False:
             if return_numpy is False:
@@ -254,6 +262,15 @@ class RNASeqMixin:
                 "batches."
             )
 
+        # torch.autocast validates the device type even when disabled, so only
+        # construct it when bf16 inference is actually requested; the importance
+        # weighting downstream expects float32 log-probabilities, hence the
+        # store_distributions guard
+        if settings.autocast_inference and not store_distributions:
+            autocast_ctx = torch.autocast(device_type=self.device.type, dtype=torch.bfloat16)
+        else:
+            autocast_ctx = nullcontext()
+
         exprs = []
         zs = []
         qz_store = DistributionConcatenator()
@@ -263,21 +280,23 @@ class RNASeqMixin:
             for batch in transform_batch:
                 generative_kwargs = self._get_transform_batch_gen_kwargs(batch)
                 inference_kwargs = {"n_samples": n_samples}
-                inference_outputs, generative_outputs = self.module.forward(
-                    tensors=tensors,
-                    inference_kwargs=inference_kwargs,
-                    generative_kwargs=generative_kwargs,
-                    compute_loss=False,
-                )
-                exp_ = generative_outputs["px"].get_normalized(generative_output_key)
-                exp_ = exp_[..., gene_mask]
+                with autocast_ctx:
+                    inference_outputs, generative_outputs = self.module.forward(
+                        tensors=tensors,
+                        inference_kwargs=inference_kwargs,
+                        generative_kwargs=generative_kwargs,
+                        compute_loss=False,
+                    )
+                exp_ = generative_outputs["px"].get_normalized(generative_output_key).float()
+                if gene_idx is not None:
+                    exp_ = torch.index_select(exp_, -1, gene_idx)
                 exp_ *= scaling
                 per_batch_exprs.append(exp_[None].cpu())
                 if store_distributions:
                     qz_store.store_distribution(inference_outputs["qz"])
                     px_store.store_distribution(generative_outputs["px"])
 
-            zs.append(inference_outputs["z"].cpu())
+            zs.append(inference_outputs["z"].float().cpu())
             per_batch_exprs = torch.cat(per_batch_exprs, dim=0).mean(0).numpy()
             exprs.append(per_batch_exprs)
 
@@ -463,7 +482,7 @@ class RNASeqMixin:
         if gene_list is None:
             gene_mask = slice(None)
         else:
-            gene_mask = [gene in gene_list for gene in adata.var_names]
+            gene_mask = adata.var_names.isin(gene_list)
             if not np.any(gene_mask):
                 raise ValueError(
                     "None of the provided genes in ``gene_list`` were detected in the data."
@@ -505,7 +524,9 @@ class RNASeqMixin:
         rna_size_factor
             size factor for RNA prior to sampling gamma distribution.
         transform_batch
-            int of which batch to condition on for all cells.
+            int of which batch to condition on for all cells. If a list is provided, the
+            recognition model runs only once per minibatch and its outputs are decoded for
+            each conditioned batch, with samples returned along a leading axis.
 
         Returns
         -------
@@ -514,46 +535,41 @@ class RNASeqMixin:
         adata = self._validate_anndata(adata)
         scdl = self._make_data_loader(adata=adata, indices=indices, batch_size=batch_size)
 
-        data_loader_list = []
-        for tensors in scdl:
-            x = tensors[REGISTRY_KEYS.X_KEY]
-            generative_kwargs = self._get_transform_batch_gen_kwargs(transform_batch)
-            inference_kwargs = {"n_samples": n_samples}
-            _, generative_outputs = self.module.forward(
-                tensors=tensors,
-                inference_kwargs=inference_kwargs,
-                generative_kwargs=generative_kwargs,
-                compute_loss=False,
-            )
-            if "px" in generative_outputs:
-                px_scale = generative_outputs["px"].scale
-                px_r = generative_outputs["px"].theta
-            else:
-                px_scale = generative_outputs["px_scale"]
-                px_r = generative_outputs["px_r"]
-            device = px_r.device
-
-            rate = rna_size_factor * px_scale
-            if len(px_r.size()) == 2:
-                px_dispersion = px_r
-            else:
-                px_dispersion = torch.ones_like(x).to(device) * px_r
-
-            # This gamma is really l*w using scVI manuscript notation
-            p = rate / (rate + px_dispersion)
-            r = px_dispersion
-            l_train = torch.distributions.Gamma(r, (1 - p) / p).sample()
-            data = l_train.cpu().numpy()
-            # """
-            # In numpy (shape, scale) => (concentration, rate), with scale = p /(1 - p)
-            # rate = (1 - p) / p  # = 1/scale # used in pytorch
-            # """
-            data_loader_list += [data]
+        single_batch = not isinstance(transform_batch, (list, tuple, np.ndarray))
+        transform_batches = [transform_batch] if single_batch else list(transform_batch)
 
-            if n_samples > 1:
-                data_loader_list[-1] = np.transpose(data_loader_list[-1], (1, 2, 0))
-
-        return np.concatenate(data_loader_list, axis=0)
+        data_loader_lists = [[] for _ in transform_batches]
+        for tensors in scdl:
+            # run the recognition model once per minibatch; only the generative half
+            # depends on the conditioned batch
+            inference_inputs = self.module._get_inference_input(tensors)
+            inference_outputs = self.module.inference(**inference_inputs, n_samples=n_samples)
+            generative_inputs = self.module._get_generative_input(tensors, inference_outputs)
+            for batch_list, batch in zip(data_loader_lists, transform_batches, strict=True):
+                generative_kwargs = self._get_transform_batch_gen_kwargs(batch)
+                generative_outputs = self.module.generative(
+                    **generative_inputs, **generative_kwargs
+                )
+                if "px" in generative_outputs:
+                    px_scale = generative_outputs["px"].scale
+                    px_r = generative_outputs["px"].theta
+                else:
+                    px_scale = generative_outputs["px_scale"]
+                    px_r = generative_outputs["px_r"]
+
+                # This gamma is really l*w using scVI manuscript notation. With
+                # p = rate / (rate + dispersion), the torch rate parameter (1 - p) / p
+                # simplifies to dispersion / rate, so neither p nor the broadcasted
+                # dispersion tensor needs to be materialized.
+                rate = rna_size_factor * px_scale
+                l_train = torch.distributions.Gamma(px_r, px_r / rate).sample()
+                data = l_train.cpu().numpy()
+                if n_samples > 1:
+                    data = np.transpose(data, (1, 2, 0))
+                batch_list.append(data)
+
+        denoised = np.stack([np.concatenate(chunks, axis=0) for chunks in data_loader_lists])
+        return denoised[0] if single_batch else denoised
 
     @torch.inference_mode()
     def get_feature_correlation_matrix(
@@ -603,26 +619,23 @@ class RNASeqMixin:
             self.get_anndata_manager(adata, required=True), transform_batch
         )
 
+        # one pass over the posterior: the encoder is shared across conditioned batches
+        all_denoised_data = self._get_denoised_samples(
+            adata=adata,
+            indices=indices,
+            n_samples=n_samples,
+            batch_size=batch_size,
+            rna_size_factor=rna_size_factor,
+            transform_batch=transform_batch,
+        )
         corr_mats = []
-        for b in transform_batch:
-            denoised_data = self._get_denoised_samples(
-                adata=adata,
-                indices=indices,
-                n_samples=n_samples,
-                batch_size=batch_size,
-                rna_size_factor=rna_size_factor,
-                transform_batch=b,
-            )
-            flattened = np.zeros((denoised_data.shape[0] * n_samples, denoised_data.shape[1]))
-            for i in range(n_samples):
-                if n_samples == 1:
-                    flattened[denoised_data.shape[0] * (i) : denoised_data.shape[0] * (i + 1)] = (
-                        denoised_data[:, :]
-                    )
-                else:
-                    flattened[denoised_data.shape[0] * (i) : denoised_data.shape[0] * (i + 1)] = (
-                        denoised_data[:, :, i]
-                    )
+        for denoised_data in all_denoised_data:
+            if n_samples == 1:
+                flattened = denoised_data
+            else:
+                # (n_cells, n_genes, n_samples) -> (n_samples * n_cells, n_genes) with samples
+                # stacked along the cell axis, in one copy instead of a per-sample Python loop.
+                flattened = denoised_data.transpose(2, 0, 1).reshape(-1, denoised_data.shape[1])
             if correlation_type == "pearson":
                 corr_matrix = np.corrcoef(flattened, rowvar=False)
             elif correlation_type == "spearman":
@@ -663,9 +676,14 @@ class RNASeqMixin:
 
         scdl = self._make_data_loader(adata=adata, indices=indices, batch_size=batch_size)
 
-        dropout_list = []
-        mean_list = []
-        dispersion_list = []
+        n_obs = adata.n_obs if indices is None else len(indices)
+
+        # preallocate the outputs and write each minibatch into its slice along the cell
+        # axis, instead of accumulating per-batch arrays and paying a final concatenate copy
+        means = None
+        dispersions = None
+        dropout = None
+        cursor = 0
         for tensors in scdl:
             inference_kwargs = {"n_samples": n_samples}
             _, generative_outputs = self.module.forward(
@@ -674,24 +692,27 @@ class RNASeqMixin:
                 compute_loss=False,
             )
             px = generative_outputs["px"]
-            px_r = px.theta
-            px_rate = px.mu
-            if self.module.gene_likelihood == "zinb":
-                px_dropout = px.zi_probs
-
-            n_batch = px_rate.size(0) if n_samples == 1 else px_rate.size(1)
-
-            px_r = px_r.cpu().numpy()
-            if len(px_r.shape) == 1:
-                dispersion_list += [np.repeat(px_r[np.newaxis, :], n_batch, axis=0)]
-            else:
-                dispersion_list += [px_r]
-            mean_list += [px_rate.cpu().numpy()]
+            px_rate = px.mu.cpu().numpy()
+            # the distribution broadcasts gene- and gene-batch-level dispersions to the
+            # rate's shape on construction, so theta always fills the full output
+            px_r = px.theta.cpu().numpy()
+
+            if means is None:
+                shape = (n_obs, px_rate.shape[-1])
+                if n_samples > 1:
+                    shape = (n_samples, *shape)
+                means = np.empty(shape, dtype=px_rate.dtype)
+                dispersions = np.empty(shape, dtype=px_r.dtype)
+                if self.module.gene_likelihood == "zinb":
+                    dropout = np.empty(shape, dtype=px_rate.dtype)
+
+            n_batch = px_rate.shape[0] if n_samples == 1 else px_rate.shape[1]
+            cells = slice(cursor, cursor + n_batch)
+            means[..., cells, :] = px_rate
+            dispersions[..., cells, :] = px_r
             if self.module.gene_likelihood == "zinb":
-                dropout_list += [px_dropout.cpu().numpy()]
-                dropout = np.concatenate(dropout_list, axis=-2)
-        means = np.concatenate(mean_list, axis=-2)
-        dispersions = np.concatenate(dispersion_list, axis=-2)
+                dropout[..., cells, :] = px.zi_probs.cpu().numpy()
+            cursor += n_batch
 
         if give_mean and n_samples > 1:
             if self.module.gene_likelihood == "zinb":
@@ -756,5 +777,5 @@ class RNASeqMixin:
                         "library size instead."
                     )
                 library = torch.distributions.LogNormal(ql.loc, ql.scale).mean
-            libraries += [library.cpu()]
-        return torch.cat(libraries).numpy()
+            libraries.append(library)
+        return torch.cat(libraries).cpu().numpy()
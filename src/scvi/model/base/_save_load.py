@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import os
+import pickle
 import warnings
 from typing import TYPE_CHECKING
 
@@ -26,6 +27,16 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# trust the numpy reconstruction hooks so archives whose attr dicts hold only
+# numpy payloads pass the restricted weights_only load in _load_saved_files
+if hasattr(torch.serialization, "add_safe_globals"):
+    try:
+        from numpy._core.multiarray import _reconstruct
+    except ImportError:  # numpy < 2.0
+        from numpy.core.multiarray import _reconstruct
+
+    torch.serialization.add_safe_globals([np.ndarray, np.dtype, _reconstruct])
+
 
 def _load_legacy_saved_files(
     dir_path: str,
@@ -40,7 +51,9 @@ def _load_legacy_saved_files(
         dir_path, f"{file_name_prefix}{SAVE_KEYS.LEGACY_SETUP_DICT_FNAME}"
     )
 
-    model_state_dict = torch.load(model_path, map_location="cpu")
+    # legacy model files only hold the state dict, so unpickling of arbitrary
+    # objects can be disabled
+    model_state_dict = torch.load(model_path, map_location="cpu", weights_only=True)
 
     var_names = np.genfromtxt(var_names_path, delimiter=",", dtype=str)
 
@@ -73,7 +86,22 @@ def _load_saved_files(
     model_path = os.path.join(dir_path, model_file_name)
     try:
         _download(backup_url, dir_path, model_file_name)
-        model = torch.load(model_path, map_location=map_location)
+        try:
+            # memory-map the zip-backed tensors so load peaks at O(largest tensor)
+            # host memory instead of a full copy of the state dict
+            try:
+                model = torch.load(
+                    model_path, map_location=map_location, mmap=True, weights_only=True
+                )
+            except pickle.UnpicklingError:
+                # attr dicts may hold objects (registries, DataFrames) that the
+                # restricted deserializer has not been told to trust
+                model = torch.load(
+                    model_path, map_location=map_location, mmap=True, weights_only=False
+                )
+        except RuntimeError:
+            # files written before the zipfile serialization format cannot be mapped
+            model = torch.load(model_path, map_location=map_location, weights_only=False)
     except FileNotFoundError as exc:
         raise ValueError(
             f"Failed to load model file at {model_path}. "
@@ -85,6 +113,17 @@ def _load_saved_files(
     var_names = model.get(SAVE_KEYS.VAR_NAMES_KEY)
     attr_dict = model.get(SAVE_KEYS.ATTR_DICT_KEY)
 
+    if model_state_dict is None:
+        # state dict was saved in a sidecar safetensors file (save_safetensors=True);
+        # load_file memory-maps the raw tensor buffers
+        from safetensors.torch import load_file
+
+        safetensors_path = os.path.join(
+            dir_path, f"{file_name_prefix}{SAVE_KEYS.MODEL_SAFETENSORS_FNAME}"
+        )
+        # safetensors expects a string device identifier, not a torch.device
+        model_state_dict = load_file(safetensors_path, device=str(map_location or "cpu"))
+
     if load_adata:
         is_mudata = attr_dict["registry_"].get(_SETUP_METHOD_NAME) == "setup_mudata"
         file_suffix = SAVE_KEYS.ADATA_FNAME if is_mudata is False else SAVE_KEYS.MDATA_FNAME
@@ -119,12 +158,18 @@ def _initialize_model(cls, adata, attr_dict):
         kwargs = init_params["kwargs"]
 
         # expand out kwargs
-        kwargs = {k: v for (i, j) in kwargs.items() for (k, v) in j.items()}
+        flat_kwargs = {}
+        for sub_kwargs in kwargs.values():
+            flat_kwargs.update(sub_kwargs)
+        kwargs = flat_kwargs
     else:
         # grab all the parameters except for kwargs (is a dict)
         non_kwargs = {k: v for k, v in init_params.items() if not isinstance(v, dict)}
-        kwargs = {k: v for k, v in init_params.items() if isinstance(v, dict)}
-        kwargs = {k: v for (i, j) in kwargs.items() for (k, v) in j.items()}
+        flat_kwargs = {}
+        for v in init_params.values():
+            if isinstance(v, dict):
+                flat_kwargs.update(v)
+        kwargs = flat_kwargs
         non_kwargs.pop("use_cuda")
 
     # backwards compat for scANVI
@@ -134,8 +179,14 @@ def _initialize_model(cls, adata, attr_dict):
         non_kwargs.pop("pretrained_model")
 
     model = cls(adata, **non_kwargs, **kwargs)
-    for attr, val in attr_dict.items():
-        setattr(model, attr, val)
+    # saved attributes are plain trailing-underscore instance attributes, so the
+    # per-key descriptor resolution of setattr can usually be skipped; keep the
+    # setattr path in case a class defines a descriptor under one of the keys
+    if any(hasattr(type(model), attr) for attr in attr_dict):
+        for attr, val in attr_dict.items():
+            setattr(model, attr, val)
+    else:
+        vars(model).update(attr_dict)
 
     return model
 
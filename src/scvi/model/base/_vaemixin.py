@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import logging
+from contextlib import nullcontext
 from typing import TYPE_CHECKING
 
 import torch
 
+from scvi import settings
 from scvi.utils import unsupported_if_adata_minified
 
 if TYPE_CHECKING:
@@ -286,13 +288,21 @@ class VAEMixin:
                 adata=adata, indices=indices, batch_size=batch_size
             )
 
+        # torch.autocast validates the device type even when disabled, so only
+        # construct it when bf16 inference is actually requested
+        if settings.autocast_inference:
+            autocast_ctx = torch.autocast(device_type=self.device.type, dtype=torch.bfloat16)
+        else:
+            autocast_ctx = nullcontext()
+
         zs: list[Tensor] = []
         qz_means: list[Tensor] = []
         qz_vars: list[Tensor] = []
         for tensors in dataloader:
-            outputs: dict[str, Tensor | Distribution | None] = self.module.inference(
-                **self.module._get_inference_input(tensors)
-            )
+            with autocast_ctx:
+                outputs: dict[str, Tensor | Distribution | None] = self.module.inference(
+                    **self.module._get_inference_input(tensors)
+                )
 
             if MODULE_KEYS.QZ_KEY in outputs:
                 qz: Distribution = outputs.get(MODULE_KEYS.QZ_KEY)
@@ -304,8 +314,8 @@ class VAEMixin:
                 qz: Distribution = Normal(qzm, qzv.sqrt())
 
             if return_dist:
-                qz_means.append(qzm.cpu())
-                qz_vars.append(qzv.cpu())
+                qz_means.append(qzm)
+                qz_vars.append(qzv)
                 continue
 
             z: Tensor = qzm if give_mean else outputs.get(MODULE_KEYS.Z_KEY)
@@ -314,9 +324,14 @@ class VAEMixin:
                 samples = qz.sample([mc_samples])
                 z = softmax(samples, dim=-1).mean(dim=0)
 
-            zs.append(z.cpu())
+            zs.append(z)
 
+        # concatenate on the device before a single host transfer to avoid one
+        # device-to-host sync per minibatch; .float() restores float32 under autocast
         if return_dist:
-            return torch.cat(qz_means).numpy(), torch.cat(qz_vars).numpy()
+            return (
+                torch.cat(qz_means).float().cpu().numpy(),
+                torch.cat(qz_vars).float().cpu().numpy(),
+            )
         else:
-            return torch.cat(zs).numpy()
+            return torch.cat(zs).float().cpu().numpy()
@@ -1,5 +1,6 @@
+import numpy as np
 from anndata import AnnData
-from scipy.sparse import csr_matrix
+from scipy.sparse import csr_matrix, issparse
 
 from scvi._types import MinifiedDataType
 from scvi.data._constants import (
@@ -9,6 +10,37 @@ from scvi.data._constants import (
 )
 
 
+def _observed_lib_size(counts) -> np.ndarray:
+    """Computes per-cell library sizes of a count matrix.
+
+    For CSR matrices without empty rows, the row sums reduce to a single segmented
+    pass over the ``data`` array, skipping the sparse ``sum`` machinery and its
+    intermediate ``np.matrix`` result.
+    """
+    if isinstance(counts, csr_matrix):
+        # reduceat requires every row to be non-empty, as empty segments would
+        # repeat the next row's leading entry instead of yielding zero
+        if (np.diff(counts.indptr) > 0).all():
+            # match the sparse sum's accumulator: reduceat would otherwise keep the
+            # dtype of ``data`` and overflow small integer count layers
+            acc_dtype = counts.dtype if np.issubdtype(counts.dtype, np.floating) else np.int64
+            return np.add.reduceat(counts.data, counts.indptr[:-1], dtype=acc_dtype)
+
+    n_obs = counts.shape[0]
+    block_size = 65_536
+    # disk-backed layers have no sum method and should stream block-wise anyway
+    in_memory = isinstance(counts, np.ndarray) or issparse(counts)
+    if in_memory and n_obs <= block_size:
+        return np.asarray(counts.sum(axis=1)).ravel()
+    # reduce in fixed-size row blocks so disk-backed layers stream through bounded
+    # memory instead of being materialized in full
+    lib = np.empty(n_obs)
+    for start in range(0, n_obs, block_size):
+        block = counts[start : start + block_size]
+        lib[start : start + block_size] = np.asarray(block.sum(axis=1)).ravel()
+    return lib
+
+
 def get_minified_adata_scrna(
     adata: AnnData,
     minified_data_type: MinifiedDataType,
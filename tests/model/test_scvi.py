@@ -166,6 +166,52 @@ def test_saving_and_loading(save_path):
     test_save_load_model(SCVI, adata, save_path, prefix=f"{SCVI.__name__}_")
 
 
+def test_saving_and_loading_safetensors(save_path):
+    pytest.importorskip("safetensors")
+
+    save_path = os.path.join(save_path, "safetensors")
+    adata = synthetic_iid()
+    SCVI.setup_anndata(adata, batch_key="batch", labels_key="labels")
+    model = SCVI(adata, n_latent=5)
+    model.train(1, train_size=0.5)
+    z1 = model.get_latent_representation(adata)
+
+    model.save(save_path, overwrite=True, save_anndata=True, save_safetensors=True)
+    assert os.path.exists(os.path.join(save_path, "model.safetensors"))
+    # the archive with var_names and attributes is still written alongside
+    assert os.path.exists(os.path.join(save_path, "model.pt"))
+
+    model = SCVI.load(save_path)
+    z2 = model.get_latent_representation()
+    np.testing.assert_array_equal(z1, z2)
+
+
+def test_saved_archive_format(save_path):
+    from scvi.model.base._save_load import _load_saved_files
+
+    save_path = os.path.join(save_path, "archive_format")
+    adata = synthetic_iid()
+    SCVI.setup_anndata(adata, batch_key="batch", labels_key="labels")
+    model = SCVI(adata, n_latent=5)
+    model.train(1, train_size=0.5)
+    z1 = model.get_latent_representation(adata)
+    model.save(save_path, overwrite=True, save_anndata=True)
+
+    # the atomic writes must leave no temp files behind
+    assert not any(file.endswith(".tmp") for file in os.listdir(save_path))
+
+    # the archive round-trips through the weights_only-first loader
+    attr_dict, var_names, model_state_dict, _ = _load_saved_files(save_path, load_adata=False)
+    np.testing.assert_array_equal(var_names, adata.var_names.to_numpy())
+    assert "self" not in attr_dict["init_params_"]["non_kwargs"]
+    for key, value in model.module.state_dict().items():
+        torch.testing.assert_close(value, model_state_dict[key])
+
+    model = SCVI.load(save_path)
+    z2 = model.get_latent_representation()
+    np.testing.assert_array_equal(z1, z2)
+
+
 @pytest.mark.parametrize("gene_likelihood", ["zinb", "nb", "poisson", "normal"])
 def test_scvi(gene_likelihood: str, n_latent: int = 5):
     adata = synthetic_iid()
@@ -454,6 +500,55 @@ def test_scvi_get_feature_corr_backwards_compat(n_latent: int = 5):
     model.get_feature_correlation_matrix()
 
 
+def test_scvi_likelihood_parameters_shapes():
+    adata = synthetic_iid()
+    SCVI.setup_anndata(adata, batch_key="batch", labels_key="labels")
+    model = SCVI(adata, n_latent=5)
+    model.train(1, train_size=0.5)
+
+    n_samples = 3
+    params = model.get_likelihood_parameters(n_samples=n_samples)
+    assert params["mean"].shape == (n_samples, adata.n_obs, adata.n_vars)
+    assert params["dropout"].shape == (n_samples, adata.n_obs, adata.n_vars)
+    # the distribution broadcasts gene-level dispersions to the rate's shape
+    assert params["dispersions"].shape == (n_samples, adata.n_obs, adata.n_vars)
+    # and the output must be a writable array, not a broadcast view
+    params["dispersions"][0, 0, 0] = 1.0
+
+    params = model.get_likelihood_parameters(n_samples=n_samples, give_mean=True)
+    assert params["mean"].shape == adata.shape
+    assert params["dropout"].shape == adata.shape
+    assert params["dispersions"].shape == adata.shape
+
+
+def test_scvi_feature_corr_transform_batch():
+    adata = synthetic_iid()
+    SCVI.setup_anndata(adata, batch_key="batch", labels_key="labels")
+    model = SCVI(adata, n_latent=5)
+    model.train(1, train_size=0.5)
+
+    scvi.settings.seed = 0
+    corr = model.get_feature_correlation_matrix(
+        n_samples=2, transform_batch=["batch_0", "batch_1"]
+    )
+    assert corr.shape == (adata.n_vars, adata.n_vars)
+    assert np.isfinite(corr.to_numpy()).all()
+
+    # averaging over transform batches is deterministic under a fixed seed
+    scvi.settings.seed = 0
+    corr2 = model.get_feature_correlation_matrix(
+        n_samples=2, transform_batch=["batch_0", "batch_1"]
+    )
+    np.testing.assert_allclose(corr.to_numpy(), corr2.to_numpy())
+
+    # a scalar transform_batch is equivalent to the single-element list
+    scvi.settings.seed = 0
+    corr_scalar = model.get_feature_correlation_matrix(n_samples=2, transform_batch="batch_0")
+    scvi.settings.seed = 0
+    corr_list = model.get_feature_correlation_matrix(n_samples=2, transform_batch=["batch_0"])
+    np.testing.assert_allclose(corr_scalar.to_numpy(), corr_list.to_numpy())
+
+
 def test_scvi_sparse(n_latent: int = 5):
     adata = synthetic_iid()
     adata.X = csr_matrix(adata.X)